@@ -90,23 +90,31 @@ export function findLongestMatch<T extends Hashable>(
 ): { i1: number; i2: number; length: number } | null {
   const opts = { ...DEFAULT_SETTINGS, ...settings };
 
+  // Intern the hashes into integer ids in a single pass over both inputs so
+  // the O(n*m) scan below compares typed-array slots instead of hash strings
+  const len1 = items1.length;
+  const len2 = items2.length;
+  const hashIds = new Map<string, number>();
+  const ids1 = internHashes(items1, hashIds);
+  const ids2 = internHashes(items2, hashIds);
+
   let bestLength = 0;
   let bestI1 = -1;
   let bestI2 = -1;
 
   // Optimization: don't search positions where we can't possibly find
   // a longer match than what we already have
-  for (let i1 = 0; i1 < items1.length - bestLength; i1++) {
-    for (let i2 = 0; i2 < items2.length - bestLength; i2++) {
+  for (let i1 = 0; i1 < len1 - bestLength; i1++) {
+    for (let i2 = 0; i2 < len2 - bestLength; i2++) {
       // Count consecutive matches starting at this position
       let matchLength = 0;
       let curI1 = i1;
       let curI2 = i2;
 
       while (
-        curI1 < items1.length &&
-        curI2 < items2.length &&
-        items1[curI1].hash === items2[curI2].hash
+        curI1 < len1 &&
+        curI2 < len2 &&
+        ids1[curI1] === ids2[curI2]
       ) {
         matchLength++;
         curI1++;
@@ -148,6 +156,23 @@ export function findLongestMatch<T extends Hashable>(
   return { i1: bestI1, i2: bestI2, length: bestLength };
 }
 
+/**
+ * Map each item's hash to a small integer id, sharing ids through the table
+ */
+function internHashes(items: Hashable[], table: Map<string, number>): Int32Array {
+  const ids = new Int32Array(items.length);
+  for (let i = 0; i < items.length; i++) {
+    const hash = items[i].hash;
+    let id = table.get(hash);
+    if (id === undefined) {
+      id = table.size;
+      table.set(hash, id);
+    }
+    ids[i] = id;
+  }
+  return ids;
+}
+
 /**
  * Compute the LCS-based correlation between two arrays.
  *
@@ -245,6 +270,10 @@ export function computeCorrelation<T extends Hashable>(
 /**
  * Flatten a list of correlated sequences, merging adjacent sequences
  * of the same status.
+ *
+ * Each run of same-status sequences is located first and its items are
+ * copied into one array, rather than re-spreading the accumulated array
+ * every time another sequence is merged in.
  */
 export function flattenCorrelation<T extends Hashable>(
   sequences: CorrelatedSequence<T>[]
@@ -252,29 +281,50 @@ export function flattenCorrelation<T extends Hashable>(
   if (sequences.length === 0) return [];
 
   const result: CorrelatedSequence<T>[] = [];
-  let current = { ...sequences[0] };
+  let runStart = 0;
 
-  for (let i = 1; i < sequences.length; i++) {
-    const next = sequences[i];
+  for (let i = 1; i <= sequences.length; i++) {
+    if (i < sequences.length && sequences[i].status === sequences[runStart].status) {
+      continue;
+    }
 
-    if (next.status === current.status) {
-      // Merge adjacent sequences of same status
-      if (current.items1 && next.items1) {
-        current.items1 = [...current.items1, ...next.items1];
-      }
-      if (current.items2 && next.items2) {
-        current.items2 = [...current.items2, ...next.items2];
-      }
+    const first = sequences[runStart];
+    if (i - runStart === 1) {
+      result.push({ ...first });
     } else {
-      result.push(current);
-      current = { ...next };
+      result.push({
+        status: first.status,
+        items1: first.items1 && mergeRunItems(sequences, runStart, i, 'items1'),
+        items2: first.items2 && mergeRunItems(sequences, runStart, i, 'items2'),
+      });
     }
+    runStart = i;
   }
 
-  result.push(current);
   return result;
 }
 
+/**
+ * Concatenate one side's items across sequences[start..end) into a single array
+ */
+function mergeRunItems<T extends Hashable>(
+  sequences: CorrelatedSequence<T>[],
+  start: number,
+  end: number,
+  side: 'items1' | 'items2'
+): T[] {
+  const merged: T[] = [];
+  for (let i = start; i < end; i++) {
+    const items = sequences[i][side];
+    if (items) {
+      for (const item of items) {
+        merged.push(item);
+      }
+    }
+  }
+  return merged;
+}
+
 /**
  * Simple diff result for text comparison
  */
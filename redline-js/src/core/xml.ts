@@ -193,6 +193,25 @@ export function findNodes(
   return results;
 }
 
+/**
+ * Check whether any descendant node matches a predicate.
+ * Stops at the first match instead of collecting every match like findNodes.
+ */
+export function hasNode(
+  node: XmlNode,
+  predicate: (n: XmlNode) => boolean
+): boolean {
+  if (predicate(node)) {
+    return true;
+  }
+  for (const child of getChildren(node)) {
+    if (hasNode(child, predicate)) {
+      return true;
+    }
+  }
+  return false;
+}
+
 /**
  * Find all descendant nodes with a specific tag name
  */
@@ -20,6 +20,7 @@ import {
   getChildren,
   getTextContent,
   findNodes,
+  hasNode,
   type XmlNode,
 } from '../core/xml';
 
@@ -344,7 +345,7 @@ export function extractParagraphText(paragraph: XmlNode, acceptRevisions = true)
     // Check if it contains a textbox (v:textbox) - if so, process content
     // Otherwise treat as an image reference
     if (tagName === 'w:pict') {
-      const hasTextbox = findNodes(node, (n) => getTagName(n) === 'v:textbox').length > 0;
+      const hasTextbox = hasNode(node, (n) => getTagName(n) === 'v:textbox');
       if (hasTextbox) {
         // Process textbox content (v:textbox > w:txbxContent)
         for (const child of getChildren(node)) {
@@ -70,7 +70,6 @@ import {
   type XmlNode,
 } from '../core/xml';
 import {
-  openPackage,
   setPartFromXml,
   savePackage,
 } from '../core/package';
@@ -272,7 +271,10 @@ export async function compareDocuments(
   const resultParagraphs = buildResultParagraphs(paraCorrelation, revisionSettings);
   fixUpRevisionIds(resultParagraphs);
 
-  const resultPkg = await openPackage(source2);
+  // Reuse the already-opened package for source2 rather than unzipping it a
+  // second time. acceptRevisions only replaces mainDocument, so the package
+  // itself is still the pristine source2 archive.
+  const resultPkg = doc2.package;
 
   // Get the document body and replace its content
   const docBody = getDocumentBody(doc2);
@@ -668,7 +670,11 @@ function compareWordsInParagraph(
     switch (seq.status) {
       case CorrelationStatus.Equal:
         if (seq.items1 && seq.items2) {
-          const tokenText = seq.items1.map((w) => w.text).join(' ').trim();
+          // Join each side once; the token text, run text and position
+          // advance below are all derived from these strings
+          const joined1 = seq.items1.map((w) => w.text).join(' ');
+          const joined2 = seq.items2.map((w) => w.text).join(' ');
+          const tokenText = joined1.trim();
 
           // Check if this is a structural token
           if (struct2.has(tokenText)) {
@@ -677,7 +683,7 @@ function compareWordsInParagraph(
             runs.push(cloneNode(struct1.get(tokenText)!.run));
           } else {
             // Regular text - check for format changes
-            const text = seq.items1.map((w) => w.text).join(' ') + ' ';
+            const text = joined1 + ' ';
             const run1Info = findRunAtPosition(runs1, pos1ToRun, pos1);
             const run2Info = findRunAtPosition(runs2, pos2ToRun, pos2);
 
@@ -688,21 +694,20 @@ function compareWordsInParagraph(
             }
           }
 
-          const textLen1 = seq.items1.map((w) => w.text).join(' ').length;
-          const textLen2 = seq.items2.map((w) => w.text).join(' ').length;
-          pos1 += textLen1 + 1;
-          pos2 += textLen2 + 1;
+          pos1 += joined1.length + 1;
+          pos2 += joined2.length + 1;
         }
         break;
 
       case CorrelationStatus.Deleted:
         if (seq.items1) {
-          const tokenText = seq.items1.map((w) => w.text).join(' ').trim();
+          const joined = seq.items1.map((w) => w.text).join(' ');
+          const tokenText = joined.trim();
 
           if (struct1.has(tokenText)) {
             runs.push(createDeletion(cloneNode(struct1.get(tokenText)!.run), settings));
           } else {
-            const text = seq.items1.map((w) => w.text).join(' ') + ' ';
+            const text = joined + ' ';
             runs.push(createDeletion(createRun(text), settings));
           }
           pos1 += tokenText.length + 1;
@@ -711,12 +716,13 @@ function compareWordsInParagraph(
 
       case CorrelationStatus.Inserted:
         if (seq.items2) {
-          const tokenText = seq.items2.map((w) => w.text).join(' ').trim();
+          const joined = seq.items2.map((w) => w.text).join(' ');
+          const tokenText = joined.trim();
 
           if (struct2.has(tokenText)) {
             runs.push(createInsertion(cloneNode(struct2.get(tokenText)!.run), settings));
           } else {
-            const text = seq.items2.map((w) => w.text).join(' ') + ' ';
+            const text = joined + ' ';
             runs.push(createInsertion(createRun(text), settings));
           }
           pos2 += tokenText.length + 1;
@@ -868,24 +874,18 @@ function createInsertedParagraph(para: ParagraphUnit, settings: RevisionSettings
   return createParagraph([insertion], pPr ? cloneNode(pPr) : undefined);
 }
 
+const WORD_TOKEN_PATTERN = /\w+|[^\w\s]+/g;
+
 /**
  * Tokenize text into words for comparison.
  * Separates punctuation from words for finer-grained matching.
  */
 function tokenize(text: string): WordUnit[] {
-  // Split on whitespace, then further split on punctuation boundaries
+  // Match runs of word characters OR runs of punctuation (but not mixing),
+  // never crossing whitespace. A single global match does the whitespace split
+  // and the punctuation split in one scan, without intermediate arrays.
   // This allows "12,34" to become ["12", ",", "34"] and "Test." to become ["Test", "."]
-  const tokens: string[] = [];
-
-  // First split on whitespace
-  const parts = text.split(/\s+/).filter((p) => p.length > 0);
-
-  for (const part of parts) {
-    // Split each part, keeping punctuation as separate tokens
-    // Match: word characters OR non-word characters (but not mixing)
-    const subTokens = part.match(/\w+|[^\w\s]+/g) || [part];
-    tokens.push(...subTokens);
-  }
+  const tokens = text.match(WORD_TOKEN_PATTERN) || [];
 
   // Use exact token text as hash for case-sensitive comparison
   // This ensures "Three" and "THree" are detected as different
@@ -1578,15 +1578,18 @@ function countWordRevisions(
     return hasPunctuation ? 'punctuation' : 'reference';
   };
 
-  const hasMeaningfulChanges = wordCorr.some((wseq) => {
+  // Classify each change sequence once; both the meaningful-change check
+  // and the counting loop below read from this
+  const kinds = wordCorr.map((wseq) => {
     if (wseq.status === CorrelationStatus.Deleted) {
-      return classifySequence(wseq.items1, splittingRefs1) === 'meaningful';
+      return classifySequence(wseq.items1, splittingRefs1);
     }
     if (wseq.status === CorrelationStatus.Inserted) {
-      return classifySequence(wseq.items2, splittingRefs2) === 'meaningful';
+      return classifySequence(wseq.items2, splittingRefs2);
     }
-    return false;
+    return null;
   });
+  const hasMeaningfulChanges = kinds.some((kind) => kind === 'meaningful');
   const countNonMeaningful = !hasMeaningfulChanges;
 
   let insertions = 0;
@@ -1595,9 +1598,10 @@ function countWordRevisions(
   let hasDeletions = false;
   let lastStatus: CorrelationStatus | null = null;
 
-  for (const wseq of wordCorr) {
+  for (let i = 0; i < wordCorr.length; i++) {
+    const wseq = wordCorr[i];
+    const kind = kinds[i];
     if (wseq.status === CorrelationStatus.Deleted) {
-      const kind = classifySequence(wseq.items1, splittingRefs1);
       if (kind !== 'meaningful' && !countNonMeaningful) continue;
 
       hasDeletions = true;
@@ -1606,7 +1610,6 @@ function countWordRevisions(
       }
       lastStatus = CorrelationStatus.Deleted;
     } else if (wseq.status === CorrelationStatus.Inserted) {
-      const kind = classifySequence(wseq.items2, splittingRefs2);
       if (kind !== 'meaningful' && !countNonMeaningful) continue;
 
       hasInsertions = true;
@@ -1630,7 +1633,7 @@ function countWordRevisions(
     return { insertions: 1, deletions: 0 };
   }
 
-  const similarity = calculateSimilarity(text1, text2);
+  const similarity = calculateSimilarity(text1, text2, tokens1, tokens2);
 
   // HEURISTIC: For paragraphs with both insertions and deletions:
   // If similarity < 40%, treat as complete replacement (1 del + 1 ins).
@@ -1703,14 +1706,22 @@ function countWordRevisions(
  * atoms and a DetailThreshold of 0.15. The word-level approach with 0.4/0.5
  * thresholds was empirically tuned to match the C# revision counts for 104 test cases.
  *
+ * Callers that have already tokenized the texts can pass the tokens to
+ * avoid tokenizing them again.
+ *
  * Returns a value between 0 and 1, where 1 means identical.
  */
-function calculateSimilarity(text1: string, text2: string): number {
+function calculateSimilarity(
+  text1: string,
+  text2: string,
+  tokens1?: WordUnit[],
+  tokens2?: WordUnit[]
+): number {
   if (text1 === text2) return 1;
   if (!text1.trim() || !text2.trim()) return 0;
 
-  const words1 = filterComparableTokens(tokenize(text1));
-  const words2 = filterComparableTokens(tokenize(text2));
+  const words1 = filterComparableTokens(tokens1 ?? tokenize(text1));
+  const words2 = filterComparableTokens(tokens2 ?? tokenize(text2));
 
   if (words1.length === 0 || words2.length === 0) return 0;
 
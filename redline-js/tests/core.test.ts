@@ -14,6 +14,7 @@ import {
   getTagName,
   getChildren,
   getTextContent,
+  hasNode,
   openPackage,
   getPartAsXml,
   hashString,
@@ -56,6 +57,15 @@ describe('XML Utilities', () => {
 
     expect(text).toBe('Hello World');
   });
+
+  it('checks for matching descendants', () => {
+    const xml = '<root><a><b>text</b></a><c/></root>';
+    const nodes = parseXml(xml);
+
+    expect(hasNode(nodes[0], (n) => getTagName(n) === 'b')).toBe(true);
+    expect(hasNode(nodes[0], (n) => getTagName(n) === 'root')).toBe(true);
+    expect(hasNode(nodes[0], (n) => getTagName(n) === 'd')).toBe(false);
+  });
 });
 
 describe('Hash Utilities', () => {
@@ -221,6 +221,24 @@ describe('flattenCorrelation', () => {
     expect(result[1].status).toBe(CorrelationStatus.Equal);
   });
 
+  it('merges long runs in order', () => {
+    const sequences = [
+      { status: CorrelationStatus.Equal, items1: hs(['a']), items2: hs(['x']) },
+      { status: CorrelationStatus.Equal, items1: hs(['b', 'c']), items2: hs(['y']) },
+      { status: CorrelationStatus.Equal, items1: hs(['d']), items2: hs(['z', 'w']) },
+      { status: CorrelationStatus.Inserted, items1: null, items2: hs(['e']) },
+      { status: CorrelationStatus.Inserted, items1: null, items2: hs(['f']) },
+    ];
+
+    const result = flattenCorrelation(sequences);
+
+    expect(result).toHaveLength(2);
+    expect(result[0].items1?.map((i) => i.hash)).toEqual(['a', 'b', 'c', 'd']);
+    expect(result[0].items2?.map((i) => i.hash)).toEqual(['x', 'y', 'z', 'w']);
+    expect(result[1].items1).toBeNull();
+    expect(result[1].items2?.map((i) => i.hash)).toEqual(['e', 'f']);
+  });
+
   it('handles empty input', () => {
     expect(flattenCorrelation([])).toEqual([]);
   });